@@ -10,6 +10,7 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 REDACTION_STRING = ""
+ZIP_LOCAL_FILE_HEADER = b"PK\x03\x04"
 NAMESPACES = {
     "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
     "dc": "http://purl.org/dc/elements/1.1/",
@@ -18,22 +19,41 @@ NAMESPACES = {
 }
 
 
+FORBIDDEN_ATTRIBUTES = ["w15:author", "w15:userId", "w:author", "w:initials"]
+FORBIDDEN_TAGS = ["cp:lastModifiedBy", "dc:creator"]
+
+
+def _qualified_name(prefixed_name: str) -> str:
+    """Expand a prefixed name like w:author into lxml's {namespace}name form."""
+    namespace, _, name = prefixed_name.partition(":")
+    return f"{{{NAMESPACES[namespace]}}}{name}"
+
+
+# Compiled once at import, rather than for every part of every document
+FORBIDDEN_ATTRIBUTE_XPATHS = {
+    _qualified_name(attribute): lxml.etree.XPath(f"//*[@{attribute}]", namespaces=NAMESPACES)
+    for attribute in FORBIDDEN_ATTRIBUTES
+}
+FORBIDDEN_TAGS_XPATH = lxml.etree.XPath(" | ".join(f"//{tag}" for tag in FORBIDDEN_TAGS), namespaces=NAMESPACES)
+
+
 def _strip_forbidden_attributes(root: lxml.etree._Element) -> None:
     """Remove forbidden attributes from XML elements."""
-    forbidden_attributes = ["w15:author", "w15:userId", "w:author", "w:initials"]
-    for attribute in forbidden_attributes:
-        attribute_namespace, _, attribute_name = attribute.partition(":")
-        for node in root.xpath(f"//*[@{attribute}]", namespaces=NAMESPACES):
-            node.attrib[f"{{{NAMESPACES[attribute_namespace]}}}{attribute_name}"] = REDACTION_STRING
+    for qualified_attribute, find_nodes in FORBIDDEN_ATTRIBUTE_XPATHS.items():
+        for node in find_nodes(root):
+            node.attrib[qualified_attribute] = REDACTION_STRING
 
 
 def _strip_forbidden_tags(root: lxml.etree._Element) -> None:
     """Remove content from forbidden tags."""
-    forbidden_tags = ["cp:lastModifiedBy", "dc:creator"]
-    for tag in forbidden_tags:
-        for node in root.xpath(f"//{tag}", namespaces=NAMESPACES):
-            if node.text is not None:
-                node.text = REDACTION_STRING
+    for node in FORBIDDEN_TAGS_XPATH(root):
+        if node.text is not None:
+            node.text = REDACTION_STRING
+
+
+def _looks_like_xml(content: bytes) -> bool:
+    """Check whether a part starts with markup, allowing for a byte order mark or leading whitespace."""
+    return content[:64].lstrip(b"\xef\xbb\xbf\xfe\xff\x00 \t\r\n").startswith(b"<")
 
 
 def _strip_docx_author_metadata_from_xml(xml_content: bytes) -> bytes:
@@ -50,6 +70,11 @@ def _strip_docx_author_metadata_from_xml(xml_content: bytes) -> bytes:
 
 def strip_docx_author_metadata_from_docx(input_docx: bytes) -> bytes:
     """Strip author metadata from a DOCX file in bytes form."""
+    # Reject non-zip content cheaply, with a clear BadZipFile, before building a ZipFile around it
+    if not input_docx.startswith(ZIP_LOCAL_FILE_HEADER):
+        msg = "File is not a zip file"
+        raise BadZipFile(msg)
+
     input_buffer = io.BytesIO(input_docx)
     output_buffer = io.BytesIO()
 
@@ -57,11 +82,13 @@ def strip_docx_author_metadata_from_docx(input_docx: bytes) -> bytes:
         ZipFile(input_buffer, "r") as archive_input,
         ZipFile(output_buffer, "w", compression=ZIP_DEFLATED, compresslevel=6) as archive_output,
     ):
-        for archive_filename in archive_input.namelist():
-            with archive_input.open(archive_filename, "r") as f:
-                xml_content = f.read()
-                processed_content = _strip_docx_author_metadata_from_xml(xml_content)
-                archive_output.writestr(archive_filename, processed_content)
+        for archive_member in archive_input.infolist():
+            content = archive_input.read(archive_member)
+            if _looks_like_xml(content):
+                archive_output.writestr(archive_member.filename, _strip_docx_author_metadata_from_xml(content))
+            else:
+                # Binary parts such as images carry no author metadata, so copy them with their original compression
+                archive_output.writestr(archive_member.filename, content, compress_type=archive_member.compress_type)
 
     return output_buffer.getvalue()
 
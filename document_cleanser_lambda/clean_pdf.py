@@ -1,5 +1,5 @@
 import subprocess
-from subprocess import PIPE, STDOUT
+from subprocess import DEVNULL, PIPE, STDOUT
 
 from render_pdf import visually_identical
 from tools import EXIFTOOL, PDFCPU, QPDF
@@ -17,7 +17,8 @@ def _qdf(filename: str) -> None:
 
 
 def _remove_annotations(filename: str) -> None:
-    subprocess.run([PDFCPU, "annotations", "remove", filename], check=False, timeout=10, stdout=PIPE, stderr=STDOUT)
+    # The output is never inspected, so discard it rather than buffering it in Python
+    subprocess.run([PDFCPU, "annotations", "remove", filename], check=False, timeout=10, stdout=DEVNULL, stderr=DEVNULL)
 
 
 def _remove_properties(filename: str) -> None:
@@ -58,7 +59,7 @@ def _info(filename: str) -> bytes:
 def _verify_removal(filename: str) -> bool:
     """Verify that exiftool cannot restore an author name"""
     output = subprocess.run(
-        [EXIFTOOL, "-pdf-update:all=", filename],
+        [EXIFTOOL, "-overwrite_original", "-pdf-update:all=", filename],
         check=False,
         stdout=PIPE,
         stderr=STDOUT,
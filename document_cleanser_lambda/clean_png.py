@@ -9,7 +9,7 @@ from utils import file_wrapper, image_compare
 def _clean_png(filename: str) -> None:
     # Preserve the ICC profile as that can change image colours
     output = subprocess.run(
-        [EXIFTOOL, "-all:all=", filename],
+        [EXIFTOOL, "-overwrite_original", "-all:all=", filename],
         stdout=PIPE,
         stderr=STDOUT,
         timeout=10,
@@ -1,9 +1,14 @@
 from pathlib import Path
+from uuid import uuid4
 
 import boto3
 import pytest
 from moto import mock_aws
 
+import clean_pdf
+import docx_visual_comparison
+from clean_docx import strip_docx_author_metadata_from_docx
+
 
 def load_bytes(filename):
     with Path(filename).open("rb") as f:
@@ -17,57 +22,112 @@ def test_file(filename):
     return Path(Path(__file__).parent / "test_files" / filename)
 
 
-@pytest.fixture
+# The input fixtures are immutable bytes, so each file is read once per test session
+@pytest.fixture(scope="session")
 def input_docx():
     """Load sample DOCX file as bytes"""
     return load_bytes(test_file("sample_with_author.docx"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def input_docx_with_comments():
     """Load sample DOCX file with comments as bytes"""
     return load_bytes(test_file("sample_with_author_with_comments.docx"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def input_pdf():
     """Load sample PDF file as bytes"""
     return load_bytes(test_file("sample_pdf_with_author.pdf"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def input_jpeg():
     """Load sample JPEG file as bytes"""
     """https://commons.wikimedia.org/w/index.php?title=Category:Public_domain&from=S#/media/File:Schetsen_van_vogels.jpeg"""
     return load_bytes(test_file("art.jpeg"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def input_png():
     """Load sample PNG file as bytes"""
     return load_bytes(test_file("crest.png"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def input_multipage_pdf():
     """Load sample PDF file as bytes"""
     return load_bytes(test_file("multipage.pdf"))
 
 
+@pytest.fixture(scope="session")
+def stripped_docx(input_docx):
+    """Sample DOCX file with author metadata already stripped, as bytes"""
+    return strip_docx_author_metadata_from_docx(input_docx)
+
+
+@pytest.fixture(scope="session")
+def cleaned_pdf(input_pdf):
+    """Sample PDF file after cleaning, as bytes"""
+    return clean_pdf.clean(input_pdf)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def aws_mock():
+    """Mock AWS once for the whole test session; tests are isolated from each other by their own S3 bucket"""
+    with mock_aws():
+        yield
+
+
+@pytest.fixture(scope="session")
+def cached_docx_to_pdf():
+    """Starting LibreOffice dominates the DOCX tests, so convert each distinct DOCX to PDF once per test session.
+
+    Opt-in, so that the real visual comparison tests still run every conversion through LibreOffice.
+    """
+    convert_docxes_to_pdfs = docx_visual_comparison.convert_docxes_to_pdfs
+    pdfs = {}
+
+    def convert_uncached_docxes_to_pdfs(docxes):
+        uncached = [docx for docx in dict.fromkeys(docxes) if docx not in pdfs]
+        if uncached:
+            pdfs.update(zip(uncached, convert_docxes_to_pdfs(uncached), strict=True))
+        return [pdfs[docx] for docx in docxes]
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(docx_visual_comparison, "convert_docxes_to_pdfs", convert_uncached_docxes_to_pdfs)
+        yield
+
+
 @pytest.fixture
 def s3_bucket_name():
-    """S3 bucket name for testing"""
-    return "test-bucket"
+    """Unique S3 bucket name for each test"""
+    return f"test-bucket-{uuid4().hex[:8]}"
 
 
 @pytest.fixture
 def s3_setup(s3_bucket_name):
     """Setup mocked S3 environment with bucket"""
-    with mock_aws():
-        # Create S3 client and bucket
-        s3_client = boto3.client("s3", region_name="us-east-1")
-        s3_client.create_bucket(Bucket=s3_bucket_name)
-        yield s3_client, s3_bucket_name
+    # Create S3 client and bucket
+    s3_client = boto3.client("s3", region_name="us-east-1")
+    s3_client.create_bucket(Bucket=s3_bucket_name)
+    return s3_client, s3_bucket_name
+
+
+@pytest.fixture
+def bucket_snapshot(s3_setup):
+    """Return a function which maps every key in the test bucket to its tags"""
+    s3_client, bucket_name = s3_setup
+
+    def snapshot():
+        objects = {}
+        for page in s3_client.get_paginator("list_objects_v2").paginate(Bucket=bucket_name):
+            for obj in page.get("Contents", []):
+                tag_set = s3_client.get_object_tagging(Bucket=bucket_name, Key=obj["Key"])["TagSet"]
+                objects[obj["Key"]] = {tag["Key"]: tag["Value"] for tag in tag_set}
+        return objects
+
+    return snapshot
 
 
 @pytest.fixture
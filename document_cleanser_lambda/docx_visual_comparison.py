@@ -1,5 +1,8 @@
+import atexit
+import shutil
 import subprocess
 import tempfile
+from functools import cache
 from pathlib import Path
 
 import render_pdf
@@ -7,33 +10,50 @@ import render_pdf
 
 def visually_identical(first_content, second_content) -> bool:
     """Are these two docx files visually identical?"""
-    first_pdf = convert_docx_to_pdf(first_content)
-    second_pdf = convert_docx_to_pdf(second_content)
+    if first_content == second_content:
+        # Identical bytes render identically, so there is no need to start LibreOffice
+        return True
+    first_pdf, second_pdf = convert_docxes_to_pdfs([first_content, second_content])
 
     return render_pdf.visually_identical(first_pdf, second_pdf)
 
 
-def convert_docx_to_pdf(docx_bytes) -> bytes:
+@cache
+def _libreoffice_profile_uri() -> str:
+    """Concurrent soffice processes sharing a user profile interfere with each other, so give each
+    Python process its own profile. It is kept between calls so it is only initialised once per process,
+    and removed when the process exits."""
+    profile_dir = tempfile.mkdtemp(prefix="libreoffice-profile-")
+    atexit.register(shutil.rmtree, profile_dir, ignore_errors=True)
+    return Path(profile_dir).as_uri()
+
+
+def convert_docxes_to_pdfs(docxes: list[bytes]) -> list[bytes]:
     """Convert DOCX bytes to PDF bytes using LibreOffice (soffice) in headless mode.
 
+    All the documents are converted by a single soffice run, so LibreOffice only starts up once.
+    The PDFs are returned in the same order as the DOCX files were given.
+
     It requires `soffice` to be available in PATH (install LibreOffice in the Dockerfile).
 
     Raises RuntimeError with a helpful message if conversion fails or `soffice` is missing.
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
-        docx_path = tmpdir_path / "input.docx"
-        with Path.open(docx_path, "wb") as f:
-            f.write(docx_bytes)
+        docx_paths = [tmpdir_path / f"document_{index}.docx" for index in range(len(docxes))]
+        for docx_path, docx_bytes in zip(docx_paths, docxes, strict=True):
+            with Path.open(docx_path, "wb") as f:
+                f.write(docx_bytes)
 
         try:
             subprocess.run(  # noqa: S603
                 [
                     "/usr/bin/soffice",
+                    f"-env:UserInstallation={_libreoffice_profile_uri()}",
                     "--headless",
                     "--convert-to",
                     "pdf",
-                    str(docx_path),
+                    *(str(docx_path) for docx_path in docx_paths),
                     "--outdir",
                     str(tmpdir_path),
                 ],
@@ -43,7 +63,9 @@ def convert_docx_to_pdf(docx_bytes) -> bytes:
         except subprocess.CalledProcessError as exc:
             error_message = f"LibreOffice failed to convert DOCX to PDF: {exc.stderr.decode(errors='ignore')}"
             raise RuntimeError(error_message) from exc
-        pdf_path = tmpdir_path / "input.pdf"
 
-        with Path.open(pdf_path, "rb") as f:
-            return f.read()
+        pdfs = []
+        for docx_path in docx_paths:
+            with Path.open(docx_path.with_suffix(".pdf"), "rb") as f:
+                pdfs.append(f.read())
+        return pdfs
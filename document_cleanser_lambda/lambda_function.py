@@ -1,10 +1,12 @@
 import json
 import logging
 import os
-from urllib.parse import unquote_plus
+from functools import cache
+from urllib.parse import unquote_plus, urlencode
 
 import boto3
 import rollbar
+from botocore.config import Config
 from dotenv import load_dotenv
 
 import clean_docx
@@ -28,6 +30,17 @@ MODULE_FOR_MIME_TYPE = {
     "application/pdf": clean_pdf,
 }
 
+MAJOR_VERSION = __version__.split(".", maxsplit=1)[0]
+VERSION_TAGGING = urlencode({"DOCUMENT_PROCESSOR_VERSION": __version__})
+
+S3_CLIENT_CONFIG = Config(retries={"mode": "standard", "max_attempts": 10}, tcp_keepalive=True)
+
+
+@cache
+def s3_client():
+    """Create the S3 client on first use and reuse it for every later invocation in this Lambda container"""
+    return boto3.client("s3", config=S3_CLIENT_CONFIG)
+
 
 def handle_one_record(record, s3, logger) -> None:
     # Get the document processor version
@@ -45,10 +58,9 @@ def handle_one_record(record, s3, logger) -> None:
     if "DOCUMENT_PROCESSOR_VERSION" in tags:
         existing_version = tags["DOCUMENT_PROCESSOR_VERSION"]
         try:
-            current_major_version = document_processor_version.split(".")[0]
             existing_major_version = existing_version.split(".")[0]
 
-            if current_major_version == existing_major_version:
+            if existing_major_version == MAJOR_VERSION:
                 logger.info(
                     f"File {object_key} has already been processed with compatible version {existing_version} (current: {document_processor_version}). Skipping.",
                 )
@@ -90,7 +102,7 @@ def handle_one_record(record, s3, logger) -> None:
         Key=object_key,
         Body=output_bytes,
         ContentType=s3_content_type,
-        Tagging=f"DOCUMENT_PROCESSOR_VERSION={document_processor_version}",
+        Tagging=VERSION_TAGGING,
     )
 
     logger.info(f"Successfully processed and rewrote {content_type}: {object_key}")
@@ -119,9 +131,6 @@ def lambda_handler(event, context):
     failed_message_ids = []
 
     try:
-        # Initialize S3 client
-        s3 = boto3.client("s3")
-
         # Process each SQS record
         for sqs_record in event.get("Records", []):
             message_id = sqs_record.get("messageId", "unknown")
@@ -138,7 +147,8 @@ def lambda_handler(event, context):
                     object_key = unquote_plus(s3_record["s3"]["object"]["key"])
 
                     try:
-                        handle_one_record(s3_record, s3, logger)
+                        # The client is only built once there is an object to process
+                        handle_one_record(s3_record, s3_client(), logger)
                         logger.info(f"Successfully processed object: {object_key}")
                     except Exception:
                         logger.exception(f"Failed to process file {object_key}")
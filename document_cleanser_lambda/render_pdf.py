@@ -1,24 +1,61 @@
 import hashlib
-import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from typing import cast
 
-from pdf2image import convert_from_bytes
+from pdf2image import convert_from_path
+from PIL import Image
+
+from utils import file_wrapper
+
+# visually_identical renders two PDFs at once, so split the CPUs between them. The processes only overlap when they
+# write to an output_folder: pdf2image reads piped output from one process after another, blocking the rest.
+RENDER_PROCESSES_PER_PDF = max(1, (os.cpu_count() or 1) // 2)
+
+
+def _hash_pdf_file_visually(filename: str) -> str:
+    hasher = hashlib.sha256()
+    with TemporaryDirectory() as output_folder:
+        # Uncompressed pages are about 11 MB each at 200 DPI, which would soon fill Lambda's /tmp,
+        # so write them as PNG and decode them back to pixels one at a time
+        page_paths = convert_from_path(
+            filename,
+            fmt="png",
+            output_folder=output_folder,
+            paths_only=True,
+            thread_count=RENDER_PROCESSES_PER_PDF,
+        )
+        # pdf2image annotates its result as images, but paths_only returns the page file paths in page order
+        for page_path in cast("list[str]", page_paths):
+            with Image.open(page_path) as page:
+                hasher.update(f"{page.mode} {page.width} {page.height}\n".encode())
+                hasher.update(page.tobytes())
+    return hasher.hexdigest()
 
 
 def hash_pdf_visually(pdf_bytes: bytes) -> str:
     """Hash the visual appearance of a PDF by rendering each page and hashing the images.
 
-    Uses streaming approach to process pages one at a time, keeping memory usage constant
-    regardless of document size. The PPM format is used because it's simple (just header + pixel data)
-    and produces consistent output for identical images.
+    Each page's mode and size are hashed, followed by its raw pixel data. This covers the same
+    information as a PPM file (just header + pixel data), so the hash does not depend on how the
+    pages were compressed on disk, and produces consistent output for identical images.
+
+    All pages are rendered to files in one pass and then hashed in page order, so only one page
+    is held in memory at a time regardless of document size.
     """
-    hasher = hashlib.sha256()
-    for page in convert_from_bytes(pdf_bytes, fmt="ppm"):
-        buffer = io.BytesIO()
-        page.save(buffer, format="PPM")
-        hasher.update(buffer.getvalue())
-    return hasher.hexdigest()
+    return file_wrapper(file_content=pdf_bytes, fn=_hash_pdf_file_visually, extension="pdf")
 
 
 def visually_identical(first_content: bytes, second_content: bytes) -> bool:
-    """Check if two PDFs are visually identical by comparing their rendered appearance."""
-    return hash_pdf_visually(first_content) == hash_pdf_visually(second_content)
+    """Check if two PDFs are visually identical by comparing their rendered appearance.
+
+    Rendering happens in poppler subprocesses and hashing in hashlib, both outside the GIL,
+    so the two PDFs are hashed in parallel. Each holds at most one page in memory.
+    """
+    if first_content == second_content:
+        # Identical bytes render identically, so there is no need to start poppler
+        return True
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first_hash, second_hash = executor.map(hash_pdf_visually, (first_content, second_content))
+    return first_hash == second_hash
@@ -1,10 +1,25 @@
 import io
-import re
-from zipfile import BadZipFile, ZipFile
+from functools import cache
+from zipfile import ZIP_STORED, BadZipFile, ZipFile
 
+import lxml.etree
 import pytest
 
-from clean_docx import strip_docx_author_metadata_from_docx
+from clean_docx import NAMESPACES, strip_docx_author_metadata_from_docx
+
+# The forbidden attributes and tags that should be redacted
+FORBIDDEN_ATTRIBUTES = ["w15:author", "w15:userId", "w:author", "w:initials"]
+FORBIDDEN_TAGS = ["cp:lastModifiedBy", "dc:creator"]
+
+
+def qualified_name(prefixed_name):
+    """Expand a prefixed name such as w:author into the {namespace}local form lxml uses"""
+    prefix, _, local_name = prefixed_name.partition(":")
+    return f"{{{NAMESPACES[prefix]}}}{local_name}"
+
+
+QUALIFIED_FORBIDDEN_ATTRIBUTES = {qualified_name(attr): attr for attr in FORBIDDEN_ATTRIBUTES}
+TEXT_TAG = qualified_name("w:t")
 
 
 def create_s3_event(bucket_name="test-bucket", object_key="test.docx"):
@@ -19,77 +34,54 @@ def create_s3_event(bucket_name="test-bucket", object_key="test.docx"):
     }
 
 
+def find_non_empty_forbidden_attribute(root):
+    """Return the first (attribute, value) pair where a forbidden attribute is not empty, or None"""
+    for element in root.iter(lxml.etree.Element):
+        for qualified_attr, attr in QUALIFIED_FORBIDDEN_ATTRIBUTES.items():
+            value = element.get(qualified_attr)
+            if value:
+                return attr, value
+    return None
+
+
 def assert_docx_metadata_is_stripped(docx_bytes):
     """Helper function to assert that DOCX metadata has been properly stripped"""
-    # Define the forbidden attributes and tags that should be redacted
-    forbidden_attributes = ["w15:author", "w15:userId", "w:author", "w:initials"]
-    forbidden_tags = ["cp:lastModifiedBy", "dc:creator"]
-
-    # Verify author metadata has been stripped from all XML files
+    # Parse each XML part once, then verify author metadata has been stripped from all of them
     with ZipFile(io.BytesIO(docx_bytes), "r") as archive:
-        # Check document properties metadata - should be completely empty
-        with archive.open("docProps/core.xml", "r") as f:
-            core_xml = f.read().decode("utf-8")
-
-            # All forbidden tags should be empty
-            for tag in forbidden_tags:
-                # Check for both self-closing and empty tags
-                empty_patterns = [
-                    f"<{tag}></{tag}>",  # Empty tag
-                    f"<{tag}/>",  # Self-closing tag
-                    f"<{tag}\\s*/>",  # Self-closing with whitespace
-                ]
-
-                tag_found = any(re.search(pattern, core_xml) for pattern in empty_patterns)
-                assert tag_found, (
-                    f"Tag '{tag}' should be empty in core metadata, but found: {re.findall(f'<{re.escape(tag)}[^>]*>.*?</{re.escape(tag)}>', core_xml)}"
-                )
-
-        # Check main document - author attributes should be empty but text content preserved
-        with archive.open("word/document.xml", "r") as f:
-            doc_xml = f.read().decode("utf-8")
-
-            # All forbidden attributes should be empty strings
-            for attr in forbidden_attributes:
-                # Find all instances of this attribute and verify they're empty
-                attr_pattern = f'{re.escape(attr)}="([^"]*)"'
-                attr_values = re.findall(attr_pattern, doc_xml)
-
-                # All attribute values should be empty strings
-                for value in attr_values:
-                    assert value == "", f"Attribute '{attr}' should be empty but found value: '{value}'"
-
-                # Also check that we don't have any non-empty attribute values
-                non_empty_pattern = f'{re.escape(attr)}="[^"]+[^"]"'
-                non_empty_matches = re.findall(non_empty_pattern, doc_xml)
-                assert len(non_empty_matches) == 0, f"Found non-empty {attr} attributes: {non_empty_matches}"
-
-        # Check comments file - author attributes should be empty but comment text preserved
-        if "word/comments.xml" in archive.namelist():
-            with archive.open("word/comments.xml", "r") as f:
-                comments_xml = f.read().decode("utf-8")
-
-                # All forbidden attributes in comments should be empty
-                for attr in forbidden_attributes:
-                    attr_pattern = f'{re.escape(attr)}="([^"]*)"'
-                    attr_values = re.findall(attr_pattern, comments_xml)
-
-                    for value in attr_values:
-                        assert value == "", f"Comment attribute '{attr}' should be empty but found value: '{value}'"
-
-                # Verify that comment text content is preserved (comments should still have meaningful text)
-                assert "<w:t>" in comments_xml, "Comment text content should be preserved"
-
-        # Verify that the document still contains the actual text content
-        # (to ensure we're not over-redacting and removing legitimate content)
-        with archive.open("word/document.xml", "r") as f:
-            doc_xml = f.read().decode("utf-8")
-            # The document should still contain text elements
-            assert "<w:t>" in doc_xml, "Document text content should be preserved"
-            # Should contain some meaningful text (not just empty tags)
-            text_content = re.findall(r"<w:t>([^<]*)</w:t>", doc_xml)
-            meaningful_text = [t.strip() for t in text_content if t.strip()]
-            assert len(meaningful_text) > 0, "Document should contain meaningful text content"
+        names = set(archive.namelist())
+        core_root = lxml.etree.fromstring(archive.read("docProps/core.xml"))
+        doc_root = lxml.etree.fromstring(archive.read("word/document.xml"))
+        comments_root = (
+            lxml.etree.fromstring(archive.read("word/comments.xml")) if "word/comments.xml" in names else None
+        )
+
+    # Check document properties metadata - all forbidden tags should be present and empty
+    for tag in FORBIDDEN_TAGS:
+        node = core_root.find(qualified_name(tag))
+        assert node is not None, f"Tag '{tag}' should be empty in core metadata, but it is missing"
+        assert not node.text, f"Tag '{tag}' should be empty in core metadata, but found: {node.text!r}"
+
+    # Check main document - author attributes should be empty but text content preserved
+    forbidden = find_non_empty_forbidden_attribute(doc_root)
+    assert forbidden is None, f"Attribute '{forbidden[0]}' should be empty but found value: '{forbidden[1]}'"
+
+    # Check comments file - author attributes should be empty but comment text preserved
+    if comments_root is not None:
+        forbidden = find_non_empty_forbidden_attribute(comments_root)
+        assert forbidden is None, (
+            f"Comment attribute '{forbidden[0]}' should be empty but found value: '{forbidden[1]}'"
+        )
+
+        # Verify that comment text content is preserved (comments should still have meaningful text)
+        assert next(comments_root.iter(TEXT_TAG), None) is not None, "Comment text content should be preserved"
+
+    # Verify that the document still contains the actual text content
+    # (to ensure we're not over-redacting and removing legitimate content)
+    text_elements = list(doc_root.iter(TEXT_TAG))
+    assert text_elements, "Document text content should be preserved"
+    # Should contain some meaningful text (not just empty tags)
+    has_text = any(element.text and element.text.strip() for element in text_elements)
+    assert has_text, "Document should contain meaningful text content"
 
 
 class TestStripDocxAuthorMetadata:
@@ -120,6 +112,23 @@ class TestStripDocxAuthorMetadata:
         with pytest.raises(BadZipFile):
             strip_docx_author_metadata_from_docx(b"not a docx file")
 
+    def test_strip_docx_author_rejects_content_without_zip_header(self, input_docx):
+        """Test that content which does not start with a zip header is rejected, even if a zip follows it"""
+        with pytest.raises(BadZipFile):
+            strip_docx_author_metadata_from_docx(b"not a docx file" + input_docx)
+
+    def test_strip_docx_author_copies_binary_parts_unchanged(self, input_png):
+        """Test that binary parts such as images are copied byte for byte, keeping their original compression"""
+        docx_buffer = io.BytesIO(create_clean_docx())
+        with ZipFile(docx_buffer, "a", compression=ZIP_STORED) as zf:
+            zf.writestr("word/media/image1.png", input_png)
+
+        stripped = strip_docx_author_metadata_from_docx(docx_buffer.getvalue())
+
+        with ZipFile(io.BytesIO(stripped)) as zf:
+            assert zf.read("word/media/image1.png") == input_png
+            assert zf.getinfo("word/media/image1.png").compress_type == ZIP_STORED
+
     def test_assertion_function_detects_violations(self, input_docx):
         """Test that our assertion function correctly detects violations when metadata is NOT stripped"""
 
@@ -134,30 +143,59 @@ class TestStripDocxAuthorMetadata:
         )
 
 
-class TestAssertDocxMetadataIsStripped:
-    """Comprehensive tests for the assert_docx_metadata_is_stripped function"""
-
-    def create_mock_docx_with_author_in_core(self, author_name="John Doe"):
-        """Create a minimal DOCX with author in core metadata"""
-        # Create a minimal DOCX structure with author metadata
-        docx_buffer = io.BytesIO()
-        with ZipFile(docx_buffer, "w") as zf:
-            # Content Types
-            zf.writestr(
-                "[Content_Types].xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+# Boilerplate shared by every mock DOCX; only document.xml, core.xml and comments.xml vary between them
+MOCK_CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
     <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
     <Default Extension="xml" ContentType="application/xml"/>
     <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
-    <Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
-</Types>""",
-            )
+    <Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>{comments}
+</Types>"""
+MOCK_COMMENTS_CONTENT_TYPE = """
+    <Override PartName="/word/comments.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"/>"""
 
-            # Main document
-            zf.writestr(
-                "word/document.xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+MOCK_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+    <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+    <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>{comments}
+</Relationships>"""
+MOCK_COMMENTS_RELATIONSHIP = """
+    <Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments" Target="word/comments.xml"/>"""
+
+MOCK_EMPTY_CORE_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
+                   xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:creator></dc:creator>
+    <cp:lastModifiedBy></cp:lastModifiedBy>
+</cp:coreProperties>"""
+
+
+def build_mock_docx(document_xml, core_xml=MOCK_EMPTY_CORE_XML, comments_xml=None):
+    """Zip the given XML parts together with the shared boilerplate into a minimal DOCX"""
+    has_comments = comments_xml is not None
+    docx_buffer = io.BytesIO()
+    with ZipFile(docx_buffer, "w", compression=ZIP_STORED) as zf:
+        zf.writestr(
+            "[Content_Types].xml",
+            MOCK_CONTENT_TYPES_XML.format(comments=MOCK_COMMENTS_CONTENT_TYPE if has_comments else ""),
+        )
+        zf.writestr("word/document.xml", document_xml)
+        if has_comments:
+            zf.writestr("word/comments.xml", comments_xml)
+        zf.writestr("docProps/core.xml", core_xml)
+        zf.writestr("_rels/.rels", MOCK_RELS_XML.format(comments=MOCK_COMMENTS_RELATIONSHIP if has_comments else ""))
+
+    return docx_buffer.getvalue()
+
+
+# The mock DOCX builders are pure functions of their arguments, so cache them to zip each DOCX once per test run
+
+
+@cache
+def create_mock_docx_with_author_in_core(author_name="John Doe"):
+    """Create a minimal DOCX with author in core metadata"""
+    return build_mock_docx(
+        document_xml="""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
     <w:body>
         <w:p>
@@ -167,12 +205,7 @@ class TestAssertDocxMetadataIsStripped:
         </w:p>
     </w:body>
 </w:document>""",
-            )
-
-            # Core properties with author
-            zf.writestr(
-                "docProps/core.xml",
-                f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        core_xml=f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
                    xmlns:dc="http://purl.org/dc/elements/1.1/"
                    xmlns:dcterms="http://purl.org/dc/terms/"
@@ -181,41 +214,14 @@ class TestAssertDocxMetadataIsStripped:
     <dc:creator>{author_name}</dc:creator>
     <cp:lastModifiedBy>{author_name}</cp:lastModifiedBy>
 </cp:coreProperties>""",
-            )
+    )
 
-            # Relationships
-            zf.writestr(
-                "_rels/.rels",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-    <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
-    <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
-</Relationships>""",
-            )
-
-        docx_buffer.seek(0)
-        return docx_buffer.getvalue()
-
-    def create_mock_docx_with_document_author_attributes(self, author="Jane Smith", initials="JS"):
-        """Create a minimal DOCX with author attributes in document.xml"""
-        docx_buffer = io.BytesIO()
-        with ZipFile(docx_buffer, "w") as zf:
-            # Content Types
-            zf.writestr(
-                "[Content_Types].xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-    <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-    <Default Extension="xml" ContentType="application/xml"/>
-    <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
-    <Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
-</Types>""",
-            )
 
-            # Main document with author attributes
-            zf.writestr(
-                "word/document.xml",
-                f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+@cache
+def create_mock_docx_with_document_author_attributes(author="Jane Smith", initials="JS"):
+    """Create a minimal DOCX with author attributes in document.xml"""
+    return build_mock_docx(
+        document_xml=f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
             xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml">
     <w:body>
@@ -238,53 +244,34 @@ class TestAssertDocxMetadataIsStripped:
         </w:p>
     </w:body>
 </w:document>""",
-            )
-
-            # Empty core properties
-            zf.writestr(
-                "docProps/core.xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
-                   xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:creator></dc:creator>
-    <cp:lastModifiedBy></cp:lastModifiedBy>
-</cp:coreProperties>""",
-            )
+    )
 
-            # Relationships
-            zf.writestr(
-                "_rels/.rels",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-    <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
-    <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
-</Relationships>""",
-            )
 
-        docx_buffer.seek(0)
-        return docx_buffer.getvalue()
+@cache
+def create_mock_docx_with_w15_author_only(author="Jane Smith"):
+    """Create a minimal DOCX whose only author attribute in document.xml is w15:author"""
+    return build_mock_docx(
+        document_xml=f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml">
+    <w:body>
+        <w:p>
+            <w:ins w15:author="{author}" w:id="1" w:date="2024-01-01T10:01:00Z">
+                <w:r>
+                    <w:t>Inserted text</w:t>
+                </w:r>
+            </w:ins>
+        </w:p>
+    </w:body>
+</w:document>""",
+    )
 
-    def create_mock_docx_with_comments(self, author="Bob Wilson", initials="BW"):
-        """Create a minimal DOCX with comments containing author information"""
-        docx_buffer = io.BytesIO()
-        with ZipFile(docx_buffer, "w") as zf:
-            # Content Types
-            zf.writestr(
-                "[Content_Types].xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-    <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-    <Default Extension="xml" ContentType="application/xml"/>
-    <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
-    <Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
-    <Override PartName="/word/comments.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"/>
-</Types>""",
-            )
 
-            # Main document
-            zf.writestr(
-                "word/document.xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+@cache
+def create_mock_docx_with_comments(author="Bob Wilson", initials="BW"):
+    """Create a minimal DOCX with comments containing author information"""
+    return build_mock_docx(
+        document_xml="""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
     <w:body>
         <w:p>
@@ -302,12 +289,7 @@ class TestAssertDocxMetadataIsStripped:
         </w:p>
     </w:body>
 </w:document>""",
-            )
-
-            # Comments with author information
-            zf.writestr(
-                "word/comments.xml",
-                f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        comments_xml=f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:comments xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
     <w:comment w:id="0" w:author="{author}" w:initials="{initials}" w:date="2024-01-01T10:00:00Z">
         <w:p>
@@ -317,53 +299,14 @@ class TestAssertDocxMetadataIsStripped:
         </w:p>
     </w:comment>
 </w:comments>""",
-            )
+    )
 
-            # Empty core properties
-            zf.writestr(
-                "docProps/core.xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
-                   xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:creator></dc:creator>
-    <cp:lastModifiedBy></cp:lastModifiedBy>
-</cp:coreProperties>""",
-            )
 
-            # Relationships
-            zf.writestr(
-                "_rels/.rels",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-    <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
-    <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
-    <Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments" Target="word/comments.xml"/>
-</Relationships>""",
-            )
-
-        docx_buffer.seek(0)
-        return docx_buffer.getvalue()
-
-    def create_clean_docx(self):
-        """Create a properly cleaned DOCX with no author metadata"""
-        docx_buffer = io.BytesIO()
-        with ZipFile(docx_buffer, "w") as zf:
-            # Content Types
-            zf.writestr(
-                "[Content_Types].xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-    <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-    <Default Extension="xml" ContentType="application/xml"/>
-    <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
-    <Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
-</Types>""",
-            )
-
-            # Main document with empty author attributes
-            zf.writestr(
-                "word/document.xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+@cache
+def create_clean_docx():
+    """Create a properly cleaned DOCX with no author metadata"""
+    return build_mock_docx(
+        document_xml="""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
             xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml">
     <w:body>
@@ -386,59 +329,39 @@ class TestAssertDocxMetadataIsStripped:
         </w:p>
     </w:body>
 </w:document>""",
-            )
-
-            # Properly cleaned core properties
-            zf.writestr(
-                "docProps/core.xml",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        # Properly cleaned core properties
+        core_xml="""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
                    xmlns:dc="http://purl.org/dc/elements/1.1/">
     <dc:creator/>
     <cp:lastModifiedBy/>
 </cp:coreProperties>""",
-            )
-
-            # Relationships
-            zf.writestr(
-                "_rels/.rels",
-                """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-    <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
-    <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
-</Relationships>""",
-            )
+    )
 
-        docx_buffer.seek(0)
-        return docx_buffer.getvalue()
 
-    def test_detects_author_in_core_metadata_dc_creator(self):
-        """Test that assertion detects author names in dc:creator tag"""
-        docx_bytes = self.create_mock_docx_with_author_in_core("Alice Johnson")
-
-        with pytest.raises(AssertionError) as exc_info:
-            assert_docx_metadata_is_stripped(docx_bytes)
-
-        error_message = str(exc_info.value)
-        assert "Alice Johnson" in error_message
-        # The assertion checks that tags are empty, so we expect this error message
-        assert "should be empty in core metadata" in error_message
+class TestAssertDocxMetadataIsStripped:
+    """Comprehensive tests for the assert_docx_metadata_is_stripped function"""
 
-    def test_detects_author_in_core_metadata_cp_lastmodifiedby(self):
-        """Test that assertion detects author names in cp:lastModifiedBy tag"""
-        docx_bytes = self.create_mock_docx_with_author_in_core("Bob Smith")
+    # The mock builders put the name in both core tags, or in both w:author and w15:author,
+    # so each case covers whichever tag or attribute the assertion reaches first. w:author comes
+    # first in document order, so w15:author is covered by its own test below
+    @pytest.mark.parametrize("author_name", ["Alice Johnson", "Bob Smith"])
+    def test_detects_author_in_core_metadata(self, author_name):
+        """Test that assertion detects author names in the dc:creator and cp:lastModifiedBy tags"""
+        docx_bytes = create_mock_docx_with_author_in_core(author_name)
 
         with pytest.raises(AssertionError) as exc_info:
             assert_docx_metadata_is_stripped(docx_bytes)
 
         error_message = str(exc_info.value)
-        assert "Bob Smith" in error_message
+        assert author_name in error_message
         # The assertion checks that tags are empty, so we expect this error message
         assert "should be empty in core metadata" in error_message
 
-    def test_detects_w_author_attribute_in_document(self):
-        """Test that assertion detects non-empty w:author attributes in document"""
-        docx_bytes = self.create_mock_docx_with_document_author_attributes("Jane Smith")
+    @pytest.mark.parametrize("author_name", ["Jane Smith", "Carol Davis"])
+    def test_detects_author_attribute_in_document(self, author_name):
+        """Test that assertion detects non-empty w:author and w15:author attributes in document"""
+        docx_bytes = create_mock_docx_with_document_author_attributes(author_name)
 
         with pytest.raises(AssertionError) as exc_info:
             assert_docx_metadata_is_stripped(docx_bytes)
@@ -447,22 +370,23 @@ class TestAssertDocxMetadataIsStripped:
         # Could be either w:author or w15:author that triggers first
         assert "w:author" in error_message or "w15:author" in error_message
         assert "should be empty" in error_message
-        assert "Jane Smith" in error_message
+        assert author_name in error_message
 
     def test_detects_w15_author_attribute_in_document(self):
-        """Test that assertion detects non-empty w15:author attributes in document"""
-        docx_bytes = self.create_mock_docx_with_document_author_attributes("Carol Davis")
+        """Test that assertion detects a non-empty w15:author attribute when it is the only one in the document"""
+        docx_bytes = create_mock_docx_with_w15_author_only("Dana White")
 
         with pytest.raises(AssertionError) as exc_info:
             assert_docx_metadata_is_stripped(docx_bytes)
 
         error_message = str(exc_info.value)
-        assert "w15:author" in error_message or "w:author" in error_message  # Either could trigger first
+        assert "w15:author" in error_message
         assert "should be empty" in error_message
+        assert "Dana White" in error_message
 
     def test_detects_author_attributes_in_comments(self):
         """Test that assertion detects non-empty author attributes in comments"""
-        docx_bytes = self.create_mock_docx_with_comments("Bob Wilson", "BW")
+        docx_bytes = create_mock_docx_with_comments("Bob Wilson", "BW")
 
         with pytest.raises(AssertionError) as exc_info:
             assert_docx_metadata_is_stripped(docx_bytes)
@@ -473,7 +397,7 @@ class TestAssertDocxMetadataIsStripped:
 
     def test_passes_with_clean_docx(self):
         """Test that assertion passes with properly cleaned DOCX"""
-        docx_bytes = self.create_clean_docx()
+        docx_bytes = create_clean_docx()
 
         # This should not raise an exception
         assert_docx_metadata_is_stripped(docx_bytes)
@@ -482,7 +406,7 @@ class TestAssertDocxMetadataIsStripped:
         """Test that assertion requires the document to have meaningful text content"""
         # Create DOCX with clean metadata but no meaningful text
         docx_buffer = io.BytesIO()
-        with ZipFile(docx_buffer, "w") as zf:
+        with ZipFile(docx_buffer, "w", compression=ZIP_STORED) as zf:
             zf.writestr(
                 "[Content_Types].xml",
                 """<?xml version="1.0" encoding="UTF-8"?>
@@ -527,7 +451,7 @@ class TestAssertDocxMetadataIsStripped:
         """Test that assertion requires core metadata tags to be empty, not missing"""
         # Create DOCX with missing core metadata tags
         docx_buffer = io.BytesIO()
-        with ZipFile(docx_buffer, "w") as zf:
+        with ZipFile(docx_buffer, "w", compression=ZIP_STORED) as zf:
             zf.writestr(
                 "[Content_Types].xml",
                 """<?xml version="1.0" encoding="UTF-8"?>
@@ -1,5 +1,9 @@
+import pytest
+
 import clean_jpeg
 
+pytestmark = pytest.mark.slow
+
 
 def test_clean_jpeg_removes_author_metadata(input_jpeg):
     original_info = clean_jpeg.info(input_jpeg).decode("utf-8")
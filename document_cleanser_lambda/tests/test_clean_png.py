@@ -1,5 +1,9 @@
+import pytest
+
 import clean_png
 
+pytestmark = pytest.mark.slow
+
 
 def test_clean_png_removes_author_metadata(input_png):
     original_info = clean_png.info(input_png).decode("utf-8")
@@ -1,7 +1,11 @@
 from pathlib import Path
 
+import pytest
+
 import docx_visual_comparison
 
+pytestmark = pytest.mark.slow
+
 
 def test_visually_identical_same_docx(tmp_path):
     """Ensure two identical DOCX bytes are considered visually identical"""
@@ -1,10 +1,14 @@
 import json
 import logging
 import urllib
+from contextlib import contextmanager
 from unittest.mock import patch
 
-from clean_docx import strip_docx_author_metadata_from_docx
-from lambda_function import __version__, lambda_handler
+import pytest
+
+from lambda_function import DOCX_MIME_TYPE, __version__, lambda_handler, s3_client
+
+pytestmark = pytest.mark.usefixtures("cached_docx_to_pdf")
 
 
 def create_sqs_event(bucket_name="test-bucket", object_key="test.docx", message_id="test-sqs-message-id-1"):
@@ -75,9 +79,26 @@ def create_sqs_event(bucket_name="test-bucket", object_key="test.docx", message_
     }
 
 
+@contextmanager
+def recorded_s3_operations():
+    """Record the name of every S3 operation made by the handler's S3 client"""
+    operations = []
+    events = s3_client().meta.events
+
+    def record(model, **_):
+        operations.append(model.name)
+
+    events.register("before-call.s3", record)
+    try:
+        yield operations
+    finally:
+        events.unregister("before-call.s3", record)
+
+
 class TestLambdaHandler:
     """Tests for the lambda_handler function"""
 
+    @pytest.mark.slow
     def test_lambda_handler_processes_docx_files_without_version_tag(self, s3_with_docx_file, input_docx):
         """Test lambda handler processes files without a version tag and returns empty batchItemFailures"""
         s3_client, bucket_name, object_key = s3_with_docx_file
@@ -98,6 +119,7 @@ class TestLambdaHandler:
         assert len(processed_content) > 0
         assert processed_response["ContentType"] == "binary/octet-stream"
 
+    @pytest.mark.slow
     def test_lambda_handler_processes_jpeg_files(self, s3_with_jpeg_file, input_jpeg):
         """Test lambda handler processes files without a version tag"""
         s3_client, bucket_name, object_key = s3_with_jpeg_file
@@ -115,6 +137,7 @@ class TestLambdaHandler:
         assert len(processed_content) > 0
         assert processed_response["ContentType"] == "image/jpeg"
 
+    @pytest.mark.slow
     def test_lambda_handler_processes_png_files(self, s3_with_png_file, input_png):
         """Test lambda handler processes files without a version tag"""
         s3_client, bucket_name, object_key = s3_with_png_file
@@ -132,6 +155,7 @@ class TestLambdaHandler:
         assert len(processed_content) > 0
         assert processed_response["ContentType"] == "image/png"
 
+    @pytest.mark.slow
     def test_lambda_handler_processes_pdf_files_without_version_tag(
         self,
         s3_with_multipage_pdf_file,
@@ -155,6 +179,7 @@ class TestLambdaHandler:
         assert len(processed_content) > 0
         assert processed_response["ContentType"] == "application/pdf"
 
+    @pytest.mark.slow
     @patch("lambda_function.rollbar")
     @patch("exceptions.VisuallyDifferentError")
     def test_lambda_handler_does_not_overwrite_visually_different_pdf_files(
@@ -222,13 +247,13 @@ class TestLambdaHandler:
         assert "DOCUMENT_PROCESSOR_VERSION" not in tags
 
         # Verify expected log messages
-        assert "Processing file: test.txt from bucket: test-bucket" in caplog.text
+        assert f"Processing file: test.txt from bucket: {bucket_name}" in caplog.text
         assert "Skipping unsupported unknown file: test.txt" in caplog.text
 
     @patch("lambda_function.rollbar")
-    def test_lambda_handler_handles_missing_file(self, mock_rollbar, s3_setup):
+    def test_lambda_handler_handles_missing_file(self, mock_rollbar, s3_setup, bucket_snapshot):
         """Test lambda handler handles missing S3 files and returns batchItemFailures"""
-        s3_client, bucket_name = s3_setup
+        _, bucket_name = s3_setup
 
         # Create SQS event for a file that doesn't exist
         message_id = "msg-missing-file"
@@ -241,15 +266,13 @@ class TestLambdaHandler:
         assert result == {"batchItemFailures": [{"itemIdentifier": message_id}]}
 
         # Verify no processed files were created
-        response = s3_client.list_objects_v2(Bucket=bucket_name)
-        contents = response.get("Contents", [])
-        assert len(contents) == 0, "No files should be created when source file is missing"
+        assert bucket_snapshot() == {}, "No files should be created when source file is missing"
 
     @patch("filetype.guess")
     @patch("lambda_function.rollbar")
     def test_lambda_handler_handles_corrupted_docx_files(self, rollbar, filetype_guess, s3_with_corrupted_file, caplog):
         """Test lambda handler handles corrupted DOCX files and returns batchItemFailures"""
-        filetype_guess.return_value.mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        filetype_guess.return_value.mime = DOCX_MIME_TYPE
         s3_client, bucket_name, object_key = s3_with_corrupted_file
 
         # Get original content before processing
@@ -278,7 +301,7 @@ class TestLambdaHandler:
         assert "DOCUMENT_PROCESSOR_VERSION" not in tags
 
         # Verify expected log messages and rollbar call
-        assert "Processing file: corrupted.docx from bucket: test-bucket" in caplog.text
+        assert f"Processing file: corrupted.docx from bucket: {bucket_name}" in caplog.text
         assert "File is not a valid DOCX (zip) file." in caplog.text
         rollbar.report_exc_info.assert_called()
         call_args = rollbar.report_exc_info.call_args
@@ -287,19 +310,21 @@ class TestLambdaHandler:
         assert extra_data["message_id"] == message_id
         assert "sqs_record" in extra_data
 
-    def test_lambda_handler_processes_multiple_records(self, s3_setup, input_docx):
+    @pytest.mark.slow
+    def test_lambda_handler_processes_multiple_records(self, s3_setup, input_docx, bucket_snapshot):
         """Test lambda handler processes multiple S3 records"""
         s3_client, bucket_name = s3_setup
 
         # Upload multiple DOCX files
         files = ["file1.docx", "file2.docx"]
+        original_etags = {}
         for file_key in files:
-            s3_client.put_object(
+            original_etags[file_key] = s3_client.put_object(
                 Bucket=bucket_name,
                 Key=file_key,
                 Body=input_docx,
-                ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            )
+                ContentType=DOCX_MIME_TYPE,
+            )["ETag"]
 
         # Create SQS event with multiple records wrapped in SNS message, wrapped in SQS
         s3_event = {
@@ -350,29 +375,22 @@ class TestLambdaHandler:
         lambda_handler(event, {})
 
         # Verify both files were processed in place
-        response = s3_client.list_objects_v2(Bucket=bucket_name)
-        object_keys = [obj["Key"] for obj in response.get("Contents", [])]
+        snapshot = bucket_snapshot()
 
         # Should still have exactly the original files (processed in place)
-        assert set(files).issubset(set(object_keys))
-        assert len(object_keys) == len(files)
+        assert set(snapshot) == set(files)
 
         # Verify both files were actually processed (content changed and version tagged)
         for file_key in files:
-            # Check content was processed
-            processed_response = s3_client.get_object(Bucket=bucket_name, Key=file_key)
-            processed_content = processed_response["Body"].read()
-            assert processed_content != input_docx
+            # Check content was processed without downloading it again
+            processed_head = s3_client.head_object(Bucket=bucket_name, Key=file_key)
+            assert processed_head["ETag"] != original_etags[file_key]
 
             # Check version tag was added
-            tag_response = s3_client.get_object_tagging(Bucket=bucket_name, Key=file_key)
-            tags = {tag["Key"]: tag["Value"] for tag in tag_response.get("TagSet", [])}
-            assert tags.get("DOCUMENT_PROCESSOR_VERSION") == __version__
+            assert snapshot[file_key].get("DOCUMENT_PROCESSOR_VERSION") == __version__
 
-    def test_lambda_handler_empty_records(self, s3_setup):
+    def test_lambda_handler_empty_records(self, bucket_snapshot):
         """Test lambda handler handles empty Records gracefully"""
-        s3_client, bucket_name = s3_setup
-
         # Create SNS event with S3 event that has no records, wrapped in SQS
         s3_event = {"Records": []}
 
@@ -402,18 +420,16 @@ class TestLambdaHandler:
             ],
         }
 
-        # Call lambda handler - should not raise exception
-        lambda_handler(event, {})
+        # Call lambda handler - should not raise exception or build an S3 client
+        with patch("lambda_function.s3_client") as mock_s3_client:
+            lambda_handler(event, {})
+        mock_s3_client.assert_not_called()
 
         # Verify no files were created
-        response = s3_client.list_objects_v2(Bucket=bucket_name)
-        contents = response.get("Contents", [])
-        assert len(contents) == 0
+        assert bucket_snapshot() == {}
 
-    def test_lambda_handler_no_records_key(self, s3_setup):
+    def test_lambda_handler_no_records_key(self, bucket_snapshot):
         """Test lambda handler handles missing Records key gracefully"""
-        s3_client, bucket_name = s3_setup
-
         # Create SNS event with S3 event that has no Records key
         s3_event = {}
 
@@ -443,28 +459,25 @@ class TestLambdaHandler:
             ],
         }
 
-        # Call lambda handler - should not raise exception
-        lambda_handler(event, {})
+        # Call lambda handler - should not raise exception or build an S3 client
+        with patch("lambda_function.s3_client") as mock_s3_client:
+            lambda_handler(event, {})
+        mock_s3_client.assert_not_called()
 
         # Verify no files were created
-        response = s3_client.list_objects_v2(Bucket=bucket_name)
-        contents = response.get("Contents", [])
-        assert len(contents) == 0
+        assert bucket_snapshot() == {}
 
-    def test_lambda_handler_skips_already_processed_files(self, s3_setup, input_docx):
+    def test_lambda_handler_skips_already_processed_files(self, s3_setup, stripped_docx, bucket_snapshot):
         """Test lambda handler skips files that have already been processed with the current version"""
         s3_client, bucket_name = s3_setup
         object_key = "already_processed.docx"
 
-        # First, process the file to get the processed content
-        processed_bytes = strip_docx_author_metadata_from_docx(input_docx)
-
         # Upload a DOCX file with processed content and current version tag (simulating already processed file)
         s3_client.put_object(
             Bucket=bucket_name,
             Key=object_key,
-            Body=processed_bytes,
-            ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            Body=stripped_docx,
+            ContentType=DOCX_MIME_TYPE,
             Tagging=f"DOCUMENT_PROCESSOR_VERSION={__version__}",
         )
 
@@ -475,8 +488,12 @@ class TestLambdaHandler:
         # Create SQS event
         event = create_sqs_event(bucket_name=bucket_name, object_key=object_key)
 
-        # Call lambda handler
-        lambda_handler(event, {})
+        # Call lambda handler, recording every S3 operation it makes
+        with recorded_s3_operations() as operations:
+            lambda_handler(event, {})
+
+        # The decision to skip is made from the tags alone, without downloading the file
+        assert operations == ["GetObjectTagging"]
 
         # Verify file was not re-processed (content and metadata should be unchanged)
         response_after = s3_client.get_object(Bucket=bucket_name, Key=object_key)
@@ -484,22 +501,16 @@ class TestLambdaHandler:
         current_last_modified = response_after["LastModified"]
 
         # Content should remain the same (not re-processed)
-        assert current_content == processed_bytes
+        assert current_content == stripped_docx
 
         # Last modified time should be the same (file was not updated)
         assert current_last_modified == last_modified_before
 
-        # Version tag should still be present and unchanged
-        tag_response = s3_client.get_object_tagging(Bucket=bucket_name, Key=object_key)
-        tags = {tag["Key"]: tag["Value"] for tag in tag_response.get("TagSet", [])}
-        assert tags.get("DOCUMENT_PROCESSOR_VERSION") == __version__
-
-        # Verify we only have 1 file total (the original)
-        list_response = s3_client.list_objects_v2(Bucket=bucket_name)
-        object_keys = [obj["Key"] for obj in list_response.get("Contents", [])]
-        assert len(object_keys) == 1
+        # Verify we only have 1 file total (the original), with its version tag unchanged
+        assert bucket_snapshot() == {object_key: {"DOCUMENT_PROCESSOR_VERSION": __version__}}
 
-    def test_lambda_handler_processes_files_with_different_major_version(self, s3_setup, input_docx):
+    @pytest.mark.slow
+    def test_lambda_handler_processes_files_with_different_major_version(self, s3_setup, input_docx, bucket_snapshot):
         """Test lambda handler processes files that have a different major version tag"""
         s3_client, bucket_name = s3_setup
         object_key = "old_major_version.docx"
@@ -511,7 +522,7 @@ class TestLambdaHandler:
             Bucket=bucket_name,
             Key=object_key,
             Body=input_docx,
-            ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            ContentType=DOCX_MIME_TYPE,
             Tagging=f"DOCUMENT_PROCESSOR_VERSION={version}",
         )
 
@@ -526,18 +537,10 @@ class TestLambdaHandler:
         processed_content = response["Body"].read()
         assert processed_content != input_docx
 
-        # Verify the file has the current version tag
-        tag_response = s3_client.get_object_tagging(Bucket=bucket_name, Key=object_key)
-        tags = {tag["Key"]: tag["Value"] for tag in tag_response["TagSet"]}
-        assert tags["DOCUMENT_PROCESSOR_VERSION"] == __version__
-
-        # Verify we only have 1 file total (the original, processed in place)
-        list_response = s3_client.list_objects_v2(Bucket=bucket_name)
-        object_keys = [obj["Key"] for obj in list_response.get("Contents", [])]
-        assert len(object_keys) == 1
-        assert object_key in object_keys
+        # Verify we only have 1 file total (the original, processed in place), with the current version tag
+        assert bucket_snapshot() == {object_key: {"DOCUMENT_PROCESSOR_VERSION": __version__}}
 
-    def test_lambda_handler_skips_files_with_same_major_version(self, s3_setup, input_docx, caplog):
+    def test_lambda_handler_skips_files_with_same_major_version(self, s3_setup, stripped_docx, caplog):
         """Test lambda handler skips files that have the same major version but different minor/patch version"""
         s3_client, bucket_name = s3_setup
         object_key = "same_major_version.docx"
@@ -546,15 +549,12 @@ class TestLambdaHandler:
         current_major = __version__.split(".")[0]
         version = f"{current_major}.2.5"
 
-        # First, process the file to get the processed content
-        processed_bytes = strip_docx_author_metadata_from_docx(input_docx)
-
         # Upload a DOCX file with same major version but different minor/patch
         s3_client.put_object(
             Bucket=bucket_name,
             Key=object_key,
-            Body=processed_bytes,
-            ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            Body=stripped_docx,
+            ContentType=DOCX_MIME_TYPE,
             Tagging=f"DOCUMENT_PROCESSOR_VERSION={version}",
         )
 
@@ -575,7 +575,7 @@ class TestLambdaHandler:
         current_last_modified = response_after["LastModified"]
 
         # Content should remain the same (not re-processed)
-        assert current_content == processed_bytes
+        assert current_content == stripped_docx
 
         # Last modified time should be the same (file was not updated)
         assert current_last_modified == last_modified_before
@@ -589,6 +589,7 @@ class TestLambdaHandler:
         assert f"has already been processed with compatible version {version}" in caplog.text
         assert f"current: {__version__}" in caplog.text
 
+    @pytest.mark.slow
     def test_lambda_handler_handles_malformed_version_tags(self, s3_setup, input_docx):
         """Test lambda handler handles malformed version tags gracefully"""
         s3_client, bucket_name = s3_setup
@@ -602,7 +603,7 @@ class TestLambdaHandler:
             Bucket=bucket_name,
             Key=object_key,
             Body=input_docx,
-            ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            ContentType=DOCX_MIME_TYPE,
             Tagging=f"DOCUMENT_PROCESSOR_VERSION={malformed_version}",
         )
 
@@ -622,11 +623,32 @@ class TestLambdaHandler:
         tags = {tag["Key"]: tag["Value"] for tag in tag_response["TagSet"]}
         assert tags["DOCUMENT_PROCESSOR_VERSION"] == __version__
 
+    @pytest.mark.slow
+    def test_lambda_handler_writes_version_tag_with_object(self, s3_with_docx_file):
+        """Test the version tag is set by the PutObject call itself rather than a follow-up tagging call"""
+        s3_client, bucket_name, object_key = s3_with_docx_file
+
+        # Create SQS event
+        event = create_sqs_event(bucket_name=bucket_name, object_key=object_key)
+
+        # Call lambda handler, recording every S3 operation it makes
+        with recorded_s3_operations() as operations:
+            lambda_handler(event, {})
+
+        # Exactly one write, which carries the tag
+        assert operations.count("PutObject") == 1
+        assert "PutObjectTagging" not in operations
+
+        tag_response = s3_client.get_object_tagging(Bucket=bucket_name, Key=object_key)
+        tags = {tag["Key"]: tag["Value"] for tag in tag_response["TagSet"]}
+        assert tags["DOCUMENT_PROCESSOR_VERSION"] == __version__
+
     def test_version_number_is_uri_safe(self):
         """AWS expects the tag to be URI encoded; ensure that it is URI-safe for our convenience.
         https://boto3.amazonaws.com/v1/documentation/api/1.28.3/reference/services/s3/client/put_object.html"""
         assert __version__ == urllib.parse.quote_plus(__version__)
 
+    @pytest.mark.slow
     def test_dont_process_docx_file_with_comments(
         self,
         s3_with_docx_file_with_comments,
@@ -655,12 +677,13 @@ class TestLambdaHandler:
         tags = {tag["Key"]: tag["Value"] for tag in tag_response.get("TagSet", [])}
         assert "DOCUMENT_PROCESSOR_VERSION" not in tags
 
+    @pytest.mark.slow
     @patch("filetype.guess")
     @patch("lambda_function.rollbar")
     def test_multiple_messages_partial_batch_failure(self, mock_rollbar, filetype_guess, s3_setup, input_docx):
         """Test processing multiple SQS messages where some succeed and some fail (partial batch failure)"""
         # Mock filetype to return DOCX mime type for the failing file
-        filetype_guess.return_value.mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        filetype_guess.return_value.mime = DOCX_MIME_TYPE
 
         s3_client, bucket_name = s3_setup
 
@@ -762,7 +785,7 @@ class TestLambdaHandler:
     def test_duplicate_message_id_not_added_twice(self, mock_rollbar, filetype_guess, s3_setup):
         """Test that failed message ID is not duplicated when inner exception is re-raised"""
         # Mock filetype to return DOCX mime type so file is recognized
-        filetype_guess.return_value.mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        filetype_guess.return_value.mime = DOCX_MIME_TYPE
 
         s3_client, bucket_name = s3_setup
         object_key = "fail.docx"
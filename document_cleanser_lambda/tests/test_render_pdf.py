@@ -1,7 +1,14 @@
+import io
 import re
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
 
 from clean_pdf import compare
-from render_pdf import hash_pdf_visually
+from render_pdf import hash_pdf_visually, visually_identical
+
+pytestmark = pytest.mark.slow
 
 
 def test_visually_identical(input_multipage_pdf):
@@ -10,6 +17,33 @@ def test_visually_identical(input_multipage_pdf):
     assert compare(pdf, pdf_plus_crud)
 
 
+def test_visually_identical_skips_rendering_identical_bytes(input_pdf):
+    """Test that byte-identical PDFs are reported as identical without rendering them"""
+    with patch("render_pdf.convert_from_path") as convert_from_path:
+        assert visually_identical(input_pdf, input_pdf)
+    convert_from_path.assert_not_called()
+
+
+def _pdf_of_pages(colours):
+    buffer = io.BytesIO()
+    pages = [Image.new("RGB", (200, 200), colour) for colour in colours]
+    pages[0].save(buffer, "PDF", save_all=True, append_images=pages[1:])
+    return buffer.getvalue()
+
+
+def test_hash_pdf_visually_hashes_pages_in_order_across_processes():
+    """Test that a PDF split between several pdftoppm processes is hashed in page order"""
+    colours = [(i * 20, 255 - i * 20, 128) for i in range(7)]
+    pdf = _pdf_of_pages(colours)
+
+    with patch("render_pdf.RENDER_PROCESSES_PER_PDF", 1):
+        single_process_hash = hash_pdf_visually(pdf)
+    with patch("render_pdf.RENDER_PROCESSES_PER_PDF", 3):
+        assert hash_pdf_visually(pdf) == single_process_hash
+
+    assert hash_pdf_visually(_pdf_of_pages(reversed(colours))) != single_process_hash
+
+
 def test_hash_pdf_visually_returns_valid_sha256_hash(input_multipage_pdf):
     """Test that hash_pdf_visually returns a valid SHA256 hash string"""
     result = hash_pdf_visually(input_multipage_pdf)
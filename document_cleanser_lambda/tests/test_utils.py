@@ -0,0 +1,16 @@
+import io
+
+from PIL import Image
+
+from utils import image_compare
+
+
+def test_image_compare_detects_different_sizes(input_png):
+    """Test that an image is not considered identical to a copy with extra space added to it"""
+    with Image.open(io.BytesIO(input_png)) as image:
+        padded = Image.new("RGB", (image.width + 10, image.height))
+        padded.paste(image.convert("RGB"))
+    padded_png = io.BytesIO()
+    padded.save(padded_png, format="PNG")
+
+    assert image_compare(input_png, padded_png.getvalue()) is False
@@ -1,12 +1,24 @@
 import io
+from collections.abc import Callable
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import TypeVar, overload
 
 import filetype
 from PIL import Image, ImageChops
 
+T = TypeVar("T")
 
-def file_wrapper(file_content, fn, extension) -> bytes:
+
+@overload
+def file_wrapper(file_content: bytes, fn: Callable[..., None], extension: str) -> bytes: ...
+
+
+@overload
+def file_wrapper(file_content: bytes, fn: Callable[..., T], extension: str) -> T: ...
+
+
+def file_wrapper(file_content, fn, extension):
     """Since command line utilities require filenames and not bytestrings, write the bytestring to a file,
     and call a partial function which expects a filename. Return the return value of the function,
     or the output bytes if the function returns nothing"""
@@ -23,9 +35,16 @@ def file_wrapper(file_content, fn, extension) -> bytes:
 
 def image_compare(file_content_a, file_content_b):
     """Do two files look exactly the same?"""
-    image_a = Image.open(io.BytesIO(file_content_a)).convert("RGB")
-    image_b = Image.open(io.BytesIO(file_content_b)).convert("RGB")
-    diff = ImageChops.difference(image_a, image_b)
+    if file_content_a == file_content_b:
+        # Identical bytes decode to identical pixels
+        return True
+    image_a = Image.open(io.BytesIO(file_content_a))
+    image_b = Image.open(io.BytesIO(file_content_b))
+    if image_a.size != image_b.size:
+        # Opening only reads the headers, so differently sized images are rejected without decoding any pixels.
+        # ImageChops.difference would otherwise only compare the area they have in common.
+        return False
+    diff = ImageChops.difference(image_a.convert("RGB"), image_b.convert("RGB"))
     return not diff.getbbox()
 
 